@@ -82,9 +82,11 @@ echo ""
 echo "Installing systemd units..."
 sudo cp "${REPO_DIR}/systemd/netgear-sms-poller.service" /etc/systemd/system/
 sudo cp "${REPO_DIR}/systemd/netgear-sms-poller.timer" /etc/systemd/system/
+sudo cp "${REPO_DIR}/systemd/netgear-sms-daemon.service" /etc/systemd/system/
 
 # Update user in service file
 sudo sed -i "s/YOUR_USERNAME/$USER/g" /etc/systemd/system/netgear-sms-poller.service
+sudo sed -i "s/YOUR_USERNAME/$USER/g" /etc/systemd/system/netgear-sms-daemon.service
 
 echo "✓ systemd units installed"
 echo ""
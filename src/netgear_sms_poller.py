@@ -5,7 +5,7 @@
 Netgear LM1200 SMS Poller (Authenticated API Version)
 
 Polls LM1200 modem for incoming SMS messages and forwards them via Telegram.
-Stores SMS locally in monthly-rotated JSON files for backup/history.
+Stores SMS locally in monthly-rotated JSONL files for backup/history.
 
 Version: 1.2.0 - Feature Release (Encryption, Retry, Health Check)
 
@@ -15,24 +15,26 @@ Features:
  - Hash-based SMS deduplication (robust against ID resets)
  - ID reset detection (max_sms_id_seen tracking)
  - Automatic state migration (v1.0 → v1.1)
- - Authenticated API access (aiohttp + CookieJar)
+ - Authenticated API access (aiohttp + CookieJar, session reused across runs)
  - State management (last_processed_sms_id tracking)
- - Monthly-rotated JSON storage (hash-deduplicated)
+ - Monthly-rotated JSONL storage (append-only)
  - Telegram forwarding via Bash wrapper (exit code 2 signals new SMS)
- - Graceful shutdown on SIGTERM/SIGINT (exits at safe checkpoints)
+ - Graceful shutdown on SIGTERM/SIGINT (cancels modem I/O, finishes pending saves)
  - Python 3.10+ type hints
 
 Returns (check mode):
  - Exit code 0: No new SMS
  - Exit code 1: Error (authentication failed, API error)
  - Exit code 2: New SMS forwarded (triggers Telegram alert in wrapper)
- - Exit code 130: SIGINT (KeyboardInterrupt)
+ - Exit code 130: Interrupted by SIGTERM/SIGINT
 
 CLI Modes:
  - check: Standard polling mode (called by timer)
+ - daemon: Long-running polling loop (alternative to timer, Type=notify)
  - status: Display current state (last processed ID, total count)
  - reset: Reset state (emergency use)
  - list: List all SMS in modem inbox (debug)
+ - format: Pretty-print state file (stored compact)
 
 Repository: https://github.com/fidpa/netgear-lm1200-sms-gateway
 Created: 2025-12-30
@@ -43,11 +45,15 @@ import asyncio
 import hashlib
 import json
 import logging
+import mmap
 import os
+import shlex
 import signal
+import socket
 import sys
 import time
-from dataclasses import asdict, dataclass, field
+from collections import deque
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Any
@@ -63,6 +69,22 @@ except ImportError:
     Fernet = None
     InvalidToken = None
 
+# Optional: orjson for faster JSON encode/decode (graceful degradation)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Optional: uvloop as faster asyncio event loop (graceful degradation)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
 # Configure logging (support LOG_LEVEL env var)
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
 VALID_LOG_LEVELS = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
@@ -88,6 +110,10 @@ LOGIN_URL = f"http://{NETGEAR_IP}/Forms/config"
 STATE_DIR = os.getenv("SMS_STATE_DIR", "/var/lib/netgear-sms-gateway")
 STATE_FILE = Path(STATE_DIR) / "sms-poller-state.json"
 SMS_STORAGE_DIR = Path(STATE_DIR)
+COOKIE_FILE = Path(STATE_DIR) / "cookies.pickle"  # Modem session cookie (reused across runs)
+# str paths for the per-poll state I/O (os.* calls, no Path objects per call)
+_STATE_PATH = os.fspath(STATE_FILE)
+_STATE_TMP_PATH = os.fspath(STATE_FILE.with_suffix('.tmp'))
 
 # ============================================================================
 # Configuration Constants
@@ -95,10 +121,48 @@ SMS_STORAGE_DIR = Path(STATE_DIR)
 
 # HTTP Timeouts (seconds)
 HTTP_TIMEOUT_SECONDS = 10  # API requests (login, SMS fetch)
+HTTP_CONNECT_TIMEOUT_SECONDS = 3  # TCP connect to modem (LAN)
+HTTP_KEEPALIVE_SECONDS = 600  # Idle keep-alive of the modem connection (daemon polls reuse it)
 
 # Hash List Management (deduplication)
-HASH_LIST_MAX_SIZE = 1000    # Trigger cleanup when exceeded
-HASH_LIST_TRIM_SIZE = 500    # Keep most recent N hashes after cleanup
+HASH_LIST_MAX_SIZE = 1000    # Keep most recent N hashes (oldest evicted first)
+HASH_VERSION = 2             # 1: SHA256[:16] hex, 2: BLAKE2b 53-bit int
+HASH_BITS = 53               # Exact as IEEE double: jq and other JSON tools keep hashes intact
+ARCHIVE_INDEX_LINE_LENGTH = 17  # .idx sidecar: 16 hex chars + newline per hash
+
+# State Persistence
+STATE_CHECK_PERSIST_SECONDS = 300  # Idle polls persist last_check at most this often
+
+# ============================================================================
+# JSON Helpers (orjson if available, stdlib fallback)
+# ============================================================================
+
+def _json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str (orjson.JSONDecodeError subclasses json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Reused for compact stdlib encoding (json.dumps builds a new encoder per call
+# whenever non-default arguments are passed)
+_JSON_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 encoded JSON bytes (compact unless indent, for humans only)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return _JSON_COMPACT_ENCODER.encode(obj).encode('utf-8')
+
+_STATE_DIR_READY = False  # Set once the state directory is known to exist
+
+def _ensure_state_dir() -> None:
+    """Create the state directory (state, archive, cookies) once per process."""
+    global _STATE_DIR_READY
+    if not _STATE_DIR_READY:
+        os.makedirs(STATE_DIR, exist_ok=True)
+        _STATE_DIR_READY = True
 
 # ============================================================================
 # Retry Logic Functions
@@ -173,19 +237,12 @@ async def retry_with_backoff(
                 f"Attempt {attempt}/{max_attempts} failed (transient): {e}. "
                 f"Retrying in {delay}s..."
             )
+            # Cancellation (SIGTERM/SIGINT) interrupts the delay directly
             await asyncio.sleep(delay)
 
-            # Check for shutdown signal during retry delay
-            if shutdown_requested:
-                logger.info("Shutdown requested during retry, aborting")
-                raise KeyboardInterrupt()
-
     raise Exception("Retry logic exhausted")  # Should never reach
 
-# Global shutdown flag
-shutdown_requested = False
-
-@dataclass
+@dataclass(slots=True)
 class SMSMessage:
     """
     Represents a single SMS message.
@@ -196,28 +253,59 @@ class SMSMessage:
         time: Timestamp string from modem
         content: SMS message text
         read: Whether SMS was marked as read
+        _hash: Cached dedup hash (set by compute_sms_hash, not serialized)
     """
     id: int
     number: str
     time: str
     content: str
     read: bool
+    _hash: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to archive dict (explicit, no asdict() reflection/deep copy)."""
+        return {
+            'id': self.id,
+            'number': self.number,
+            'time': self.time,
+            'content': self.content,
+            'read': self.read,
+        }
 
-def compute_sms_hash(sms: SMSMessage) -> str:
+def _hash_triple(number: str, time_str: str, content: str) -> int:
+    """BLAKE2b hash of number|time|content as HASH_BITS-bit int (not security relevant)."""
+    # Feed parts separately: same digest as hashing the joined string,
+    # without building the intermediate f-string
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(number.encode('utf-8'))
+    hasher.update(b'|')
+    hasher.update(time_str.encode('utf-8'))
+    hasher.update(b'|')
+    hasher.update(content.encode('utf-8'))
+    return int.from_bytes(hasher.digest(), 'little') >> (64 - HASH_BITS)
+
+def _legacy_hash_triple(number: str, time_str: str, content: str) -> str:
+    """SHA256[:16] hash used by hash_version 1 state files (migration only)."""
+    hash_input = f"{number}|{time_str}|{content}"
+    return hashlib.sha256(hash_input.encode('utf-8'), usedforsecurity=False).hexdigest()[:16]
+
+def compute_sms_hash(sms: SMSMessage) -> int:
     """
     Berechnet eindeutigen Hash für SMS zur Deduplizierung.
 
     Hash basiert auf: number + time + content
     (ID wird bewusst ausgelassen, da sie resetten kann)
+    Wird pro SMS nur einmal berechnet und im Objekt gecacht.
 
     Args:
         sms: SMSMessage Objekt
 
     Returns:
-        SHA256 Hash (erste 16 Zeichen für Kompaktheit)
+        BLAKE2b Hash (53-bit int, see HASH_BITS)
     """
-    hash_input = f"{sms.number}|{sms.time}|{sms.content}"
-    return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()[:16]
+    if sms._hash is None:
+        sms._hash = _hash_triple(sms.number, sms.time, sms.content)
+    return sms._hash
 
 
 def get_encryption_key() -> bytes | None:
@@ -270,7 +358,7 @@ def decrypt_sms_content(content: str, key: bytes | None) -> str:
         raise
 
 
-def compute_sms_hash_dict(msg: dict) -> str:
+def compute_sms_hash_dict(msg: dict) -> int:
     """
     Berechnet eindeutigen Hash für SMS-Dict zur Deduplizierung im JSON-Archiv.
 
@@ -281,14 +369,10 @@ def compute_sms_hash_dict(msg: dict) -> str:
         msg: SMS als dict mit keys 'number', 'time', 'content'
 
     Returns:
-        SHA256 Hash (erste 16 Zeichen für Kompaktheit)
+        BLAKE2b Hash (53-bit int, see HASH_BITS)
     """
     # Defensive: use .get() to handle legacy/corrupt entries without KeyError
-    number = msg.get('number', '')
-    time_str = msg.get('time', '')
-    content = msg.get('content', '')
-    hash_input = f"{number}|{time_str}|{content}"
-    return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()[:16]
+    return _hash_triple(msg.get('number', ''), msg.get('time', ''), msg.get('content', ''))
 
 def is_new_sms(sms: SMSMessage, state: 'SMSPollerState') -> bool:
     """
@@ -309,9 +393,17 @@ def is_new_sms(sms: SMSMessage, state: 'SMSPollerState') -> bool:
     """
     sms_hash = compute_sms_hash(sms)
 
-    # Primary: Hash-Check (zuverlässigste Methode)
-    if sms_hash in state.processed_hashes:
-        logger.debug(f"SMS #{sms.id} already processed (hash match)")
+    # Primary: Hash-Check (zuverlässigste Methode, O(1) set lookup)
+    if sms_hash in state._hash_set:
+        logger.debug("SMS #%s already processed (hash match)", sms.id)
+        return False
+
+    # Migration: hash_version 1 state still holds SHA256 hex hashes.
+    # Re-record matches in the current format so the next poll hits directly.
+    if (state.hash_version < HASH_VERSION
+            and _legacy_hash_triple(sms.number, sms.time, sms.content) in state._hash_set):
+        logger.debug("SMS #%s already processed (legacy hash match)", sms.id)
+        state.remember_hash(sms_hash)
         return False
 
     # ID-Reset Detection: Wenn aktuelle max ID < historische max ID
@@ -320,7 +412,7 @@ def is_new_sms(sms: SMSMessage, state: 'SMSPollerState') -> bool:
 
     return True
 
-@dataclass
+@dataclass(slots=True)
 class SMSPollerState:
     """
     Persistent state for SMS poller.
@@ -332,7 +424,13 @@ class SMSPollerState:
         total_sms_received: Total count of SMS received
         last_sms_timestamp: Unix timestamp of last SMS received
         latest_sms: Latest SMS for Telegram forwarding (dict format)
-        processed_hashes: List of content hashes for deduplication
+        processed_hashes: List of content hashes for deduplication (serialized form,
+            53-bit ints; hash_version 1 states keep SHA256 hex strings until evicted)
+        hash_version: Hash format of processed_hashes (see HASH_VERSION)
+
+    In memory, hashes are tracked in a set (O(1) lookup) paired with a bounded
+    deque (insertion order, oldest evicted first). processed_hashes is only
+    read on construction; to_dict() serializes the deque.
     """
     last_processed_sms_id: int = 0
     max_sms_id_seen: int = 0
@@ -340,10 +438,24 @@ class SMSPollerState:
     total_sms_received: int = 0
     last_sms_timestamp: float = 0.0
     latest_sms: dict[str, str] = field(default_factory=dict)
-    processed_hashes: list[str] = field(default_factory=list)
-
-    def update_with_new_sms(self, sms: SMSMessage, encryption_key: bytes | None) -> None:
-        """Update state with newly received SMS (encrypted)."""
+    processed_hashes: list[int] = field(default_factory=list)
+    hash_version: int = HASH_VERSION
+    _hash_order: deque[int] = field(init=False, repr=False, compare=False)
+    _hash_set: set[int] = field(init=False, repr=False, compare=False)
+    _dirty: bool = field(init=False, repr=False, compare=False)  # State differs from state file
+    _last_poll: float = field(init=False, repr=False, compare=False)  # Unthrottled last_check
+
+    def __post_init__(self) -> None:
+        self._hash_order = deque(self.processed_hashes, maxlen=HASH_LIST_MAX_SIZE)
+        self._hash_set = set(self._hash_order)
+        self._dirty = False
+        self._last_poll = self.last_check
+        if self.hash_version < HASH_VERSION:
+            self._upgrade_hash_version()
+
+    def update_with_new_sms(self, sms: SMSMessage, encryption_key: bytes | None,
+                            now: float) -> None:
+        """Update state with newly received SMS (encrypted, now = poll timestamp)."""
         sms_hash = compute_sms_hash(sms)
 
         # Update ID tracking
@@ -351,17 +463,14 @@ class SMSPollerState:
         self.max_sms_id_seen = max(self.max_sms_id_seen, sms.id)
 
         # Add hash to processed set (with size limit)
-        if sms_hash not in self.processed_hashes:
-            self.processed_hashes.append(sms_hash)
-            # Prevent unbounded growth: when exceeding max, truncate to trim size
-            # This provides buffer before next truncation (hysteresis pattern)
-            if len(self.processed_hashes) > HASH_LIST_MAX_SIZE:
-                self.processed_hashes = self.processed_hashes[-HASH_LIST_TRIM_SIZE:]
+        self.remember_hash(sms_hash)
 
         # Update timestamps and counters
-        self.last_check = time.time()
+        self._dirty = True
+        self.last_check = now
+        self._last_poll = now
         self.total_sms_received += 1
-        self.last_sms_timestamp = time.time()
+        self.last_sms_timestamp = now
         # Store latest SMS for Telegram forwarding (ENCRYPTED)
         self.latest_sms = {
             "number": sms.number,
@@ -369,25 +478,74 @@ class SMSPollerState:
             "content": encrypt_sms_content(sms.content, encryption_key)
         }
 
-    def mark_check(self) -> None:
-        """Mark check timestamp (no new SMS)."""
-        self.last_check = time.time()
-
-def signal_handler(signum, frame):
-    """
-    Handle SIGTERM/SIGINT gracefully.
-
-    For oneshot mode (check), sets flag and lets current operation complete.
-    Poll function checks this flag and exits early if set.
-    """
-    global shutdown_requested
-    sig_name = signal.Signals(signum).name
-    logger.warning(f"Shutdown signal received ({sig_name})")
-    shutdown_requested = True
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to state file dict (explicit, no asdict() reflection/deep copy)."""
+        return {
+            'last_processed_sms_id': self.last_processed_sms_id,
+            'max_sms_id_seen': self.max_sms_id_seen,
+            'last_check': self.last_check,
+            'total_sms_received': self.total_sms_received,
+            'last_sms_timestamp': self.last_sms_timestamp,
+            'latest_sms': self.latest_sms,
+            'processed_hashes': list(self._hash_order),
+            'hash_version': self.hash_version,
+        }
 
-# Register signal handlers
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'SMSPollerState':
+        """Build from state file dict (mirror of to_dict(), unknown keys ignored)."""
+        return cls(
+            latest_sms=data.get('latest_sms') or {},
+            processed_hashes=data.get('processed_hashes') or [],
+            **{k: data.get(k, default) for k, default in _STATE_FIELD_DEFAULTS.items()},
+        )
+
+    def remember_hash(self, sms_hash: int) -> None:
+        """Add hash to processed set (bounded, oldest evicted first)."""
+        if sms_hash in self._hash_set:
+            return
+        self._hash_set.add(sms_hash)
+        self._dirty = True
+        # Prevent unbounded growth: deque evicts the oldest hash when full,
+        # drop it from the lookup set before it falls out of the deque
+        evicted = None
+        if len(self._hash_order) == HASH_LIST_MAX_SIZE:
+            evicted = self._hash_order[0]
+            self._hash_set.discard(evicted)
+        self._hash_order.append(sms_hash)
+        if isinstance(evicted, str) and self.hash_version < HASH_VERSION:
+            self._upgrade_hash_version()
+
+    def _upgrade_hash_version(self) -> None:
+        """Switch to HASH_VERSION once no legacy (SHA256 hex) hashes are left."""
+        if not any(isinstance(h, str) for h in self._hash_order):
+            self.hash_version = HASH_VERSION
+            self._dirty = True
+
+    def mark_check(self, now: float) -> None:
+        """
+        Mark check timestamp (no new SMS, now = poll timestamp).
+
+        Only bumps last_check (and marks state dirty) if the persisted value
+        is older than STATE_CHECK_PERSIST_SECONDS, so idle polls don't rewrite
+        the state file every time.
+        """
+        self._last_poll = now
+        if now - self.last_check >= STATE_CHECK_PERSIST_SECONDS:
+            self.last_check = now
+            self._dirty = True
+
+    def flush_check(self) -> None:
+        """Apply the latest check time held back by mark_check() (call before final save)."""
+        if self._last_poll > self.last_check:
+            self.last_check = self._last_poll
+            self._dirty = True
+
+# Scalar field defaults, resolved once at import (no dataclass reflection per load)
+_STATE_FIELD_DEFAULTS: dict[str, Any] = {
+    f.name: f.default for f in fields(SMSPollerState)
+    if f.init and f.default is not MISSING
+}
 
 async def get_api_data(session: aiohttp.ClientSession) -> dict:
     """
@@ -400,22 +558,46 @@ async def get_api_data(session: aiohttp.ClientSession) -> dict:
         dict: JSON data from API
 
     Raises:
-        Exception: On HTTP error or invalid response
+        aiohttp.ClientResponseError: On any non-200 status (503/429 are retried)
+        json.JSONDecodeError: On invalid response
     """
-    async with session.get(API_URL, allow_redirects=True, timeout=HTTP_TIMEOUT_SECONDS) as response:
-        if response.status == 200:
-            # LM1200 returns JSON with text/plain content-type, parse manually
-            text = await response.text()
-            return json.loads(text)
-        else:
-            raise Exception(f"HTTP {response.status}: {await response.text()}")
+    async with session.get(API_URL, allow_redirects=True) as response:
+        # Typed error instead of generic Exception: is_transient_error() can
+        # classify it, and the error body is never read
+        response.raise_for_status()
+        if response.status != 200:
+            # raise_for_status() lets 204 and unfollowed 3xx through
+            raise aiohttp.ClientResponseError(
+                response.request_info, response.history, status=response.status,
+                message=f"Unexpected HTTP {response.status}", headers=response.headers)
+        # LM1200 returns JSON with text/plain content-type, parse raw bytes
+        return _json_loads(await response.read())
+
+def get_token(data: dict) -> str:
+    """
+    Extract security token from (unauthenticated) API data.
+
+    Args:
+        data: JSON data from /api/model.json
+
+    Returns:
+        str: session.secToken
+
+    Raises:
+        Exception: If no token is present
+    """
+    token = data.get('session', {}).get('secToken', '')
+    if not token:
+        raise Exception("No security token found in API response")
+    return token
 
-async def login(session: aiohttp.ClientSession) -> bool:
+async def post_login(session: aiohttp.ClientSession, token: str) -> bool:
     """
     Login to modem and create authenticated session.
 
     Args:
         session: aiohttp ClientSession with CookieJar
+        token: Security token (see get_token)
 
     Returns:
         bool: True if login successful
@@ -426,21 +608,13 @@ async def login(session: aiohttp.ClientSession) -> bool:
     if not NETGEAR_PASSWORD:
         raise Exception("NETGEAR_ADMIN_PASSWORD not set")
 
-    # Get security token from API
-    data = await get_api_data(session)
-    token = data.get('session', {}).get('secToken', '')
-
-    if not token:
-        raise Exception("No security token found in API response")
-
     # Login via Forms/config (creates session cookie)
     login_data = {
         'session.password': NETGEAR_PASSWORD,
         'token': token
     }
 
-    async with session.post(LOGIN_URL, data=login_data,
-                           allow_redirects=False, timeout=HTTP_TIMEOUT_SECONDS) as response:
+    async with session.post(LOGIN_URL, data=login_data, allow_redirects=False) as response:
         # Accept 200, 204 (No Content - success), or 302 (redirect)
         if response.status not in [200, 204, 302]:
             response_text = await response.text()
@@ -448,23 +622,136 @@ async def login(session: aiohttp.ClientSession) -> bool:
 
         return True
 
-async def fetch_sms_list(session: aiohttp.ClientSession) -> list[SMSMessage]:
+def is_authenticated(data: dict) -> bool:
+    """Check whether API data was served to a logged-in session (userRole=Admin)."""
+    return str(data.get('session', {}).get('userRole', '')).lower() == 'admin'
+
+async def get_authenticated_data(session: aiohttp.ClientSession) -> dict:
+    """
+    Fetch API data, logging in only if the session cookie is missing or expired.
+
+    Args:
+        session: aiohttp ClientSession (CookieJar may hold a previous session)
+
+    Returns:
+        dict: JSON data from API (authenticated view)
+
+    Notes:
+        The token for login is taken from the first (unauthenticated) response,
+        so a login costs GET + POST + GET instead of two token GETs.
+        sms.msgs is empty before login, so the final GET can't be skipped.
+        If the modem rejects a stale session cookie (401/403), the cookie is
+        dropped and the login is redone in place (daemon keeps its session).
+    """
+    try:
+        data = await get_api_data(session)
+    except aiohttp.ClientResponseError as e:
+        if e.status not in (401, 403):
+            raise
+        logger.info(f"Session rejected (HTTP {e.status}), dropping session cookie")
+        session.cookie_jar.clear()
+        data = await get_api_data(session)
+
+    if is_authenticated(data):
+        logger.info("Session still valid, login skipped")
+        return data
+
+    logger.info("Logging in to modem...")
+    await post_login(session, get_token(data))
+    logger.info("Login successful")
+    return await get_api_data(session)
+
+def create_session(jar: aiohttp.CookieJar) -> aiohttp.ClientSession:
     """
-    Fetch SMS list from authenticated API.
+    Create ClientSession for the modem (single host, cached DNS, central timeouts).
 
     Args:
-        session: Authenticated aiohttp ClientSession
+        jar: CookieJar holding the modem session cookie
 
     Returns:
-        list[SMSMessage]: List of SMS messages from modem
+        aiohttp.ClientSession: Session (use as async context manager)
+    """
+    connector = aiohttp.TCPConnector(
+        use_dns_cache=True,
+        ttl_dns_cache=None,  # Never expires: modem address is fixed (usually a literal IP)
+        limit=2,             # One modem, sequential requests
+        limit_per_host=2,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        force_close=False,   # Keep-alive between token fetch, login and SMS fetch
+    )
+    timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS,
+                                    connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+    return aiohttp.ClientSession(cookie_jar=jar, connector=connector, timeout=timeout)
+
+_COOKIE_SNAPSHOT: frozenset = frozenset()  # Cookies as last loaded/saved (skip no-op saves)
+
+def _cookie_snapshot(jar: aiohttp.CookieJar) -> frozenset:
+    """Comparable view of the jar contents (iterating drops expired cookies)."""
+    return frozenset((c.key, c.value, c['domain'], c['path'], c['expires']) for c in jar)
+
+def load_cookie_jar() -> aiohttp.CookieJar:
+    """
+    Create CookieJar, restoring the modem session cookie from a previous run.
+
+    Returns:
+        aiohttp.CookieJar: Jar (empty if no/corrupt cookie file)
+    """
+    global _COOKIE_SNAPSHOT
+    jar = aiohttp.CookieJar(unsafe=True)
+    if COOKIE_FILE.exists():
+        try:
+            jar.load(COOKIE_FILE)
+        except Exception as e:  # noqa: BLE001 - aiohttp raises KeyError/ValueError/... on corrupt files
+            logger.warning(f"Failed to load cookie file: {e}, logging in fresh")
+    _COOKIE_SNAPSHOT = _cookie_snapshot(jar)
+    return jar
+
+def save_cookie_jar(jar: aiohttp.CookieJar) -> None:
+    """
+    Persist session cookie for the next run (0600, non-critical on failure).
+
+    Skipped if the cookies are unchanged since load/last save, so polls that
+    reuse a valid session don't rewrite the cookie file.
+    """
+    global _COOKIE_SNAPSHOT
+    snapshot = _cookie_snapshot(jar)
+    if snapshot == _COOKIE_SNAPSHOT and COOKIE_FILE.exists():
+        return
+    temp_file = COOKIE_FILE.with_suffix('.tmp')
+    try:
+        # Create with restrictive permissions before writing the session cookie;
+        # jar.save() rewrites in place, so write a temp file and rename it
+        temp_file.touch(mode=0o600, exist_ok=True)
+        jar.save(temp_file)
+        os.chmod(temp_file, 0o600)
+        os.replace(temp_file, COOKIE_FILE)
+        _COOKIE_SNAPSHOT = snapshot
+    except OSError as e:
+        logger.warning(f"Failed to save cookie file: {e}")
+
+async def fetch_sms_list(session: aiohttp.ClientSession,
+                         known_hashes: set[int] | None = None) -> list[SMSMessage]:
+    """
+    Fetch SMS list from authenticated API (logs in if needed).
+
+    Args:
+        session: aiohttp ClientSession with CookieJar
+        known_hashes: Hashes of already processed SMS (skipped before parsing)
+
+    Returns:
+        list[SMSMessage]: SMS messages from modem (without known_hashes matches)
 
     Notes:
         SMS data is in ['sms']['msgs'] from /api/model.json
         Format: [{"id": "1", "sender": "+49...", "rxTime": "...", "text": "...", "read": false}, ...]
+        Hash is computed from the raw dict and cached on the SMSMessage, so
+        already processed SMS cost one hash + one set lookup (no object).
+        Filtering by ID (id <= last_processed_sms_id) would be cheaper but
+        drops new SMS after a modem ID reset, so known hashes are used instead.
     """
     try:
-        # Get authenticated API data
-        data = await get_api_data(session)
+        # Get authenticated API data (reuses session cookie if still valid)
+        data = await get_authenticated_data(session)
 
         # Extract SMS list
         sms_data = data.get('sms', {}).get('msgs', [])
@@ -476,29 +763,135 @@ async def fetch_sms_list(session: aiohttp.ClientSession) -> list[SMSMessage]:
         # Parse SMS messages
         sms_list = []
         for msg in sms_data:
+            number = msg.get('sender', '')      # API uses 'sender', not 'number'
+            time_str = msg.get('rxTime', '')    # API uses 'rxTime', not 'time'
+            content = msg.get('text', '')       # API uses 'text', not 'content'
+            sms_hash = _hash_triple(number, time_str, content)
+            if known_hashes is not None and sms_hash in known_hashes:
+                continue
+
             try:
                 sms = SMSMessage(
                     id=int(msg.get('id', 0)),
-                    number=msg.get('sender', ''),      # API uses 'sender', not 'number'
-                    time=msg.get('rxTime', ''),        # API uses 'rxTime', not 'time'
-                    content=msg.get('text', ''),       # API uses 'text', not 'content'
+                    number=number,
+                    time=time_str,
+                    content=content,
                     read=bool(msg.get('read', False))
                 )
-                sms_list.append(sms)
             except (ValueError, TypeError) as e:
                 logger.warning(f"Failed to parse SMS message: {e}")
                 continue
+            sms._hash = sms_hash
+            sms_list.append(sms)
 
-        logger.info(f"Found {len(sms_list)} SMS in modem inbox")
+        if known_hashes is not None:
+            logger.info(f"Found {len(sms_data)} SMS in modem inbox "
+                        f"({len(sms_data) - len(sms_list)} already processed)")
+        else:
+            logger.info(f"Found {len(sms_list)} SMS in modem inbox")
         return sms_list
 
     except KeyError as e:
         logger.error(f"SMS data not found in API response: {e}")
         return []
 
+_MONTH_CACHE: tuple[float, Path] = (0.0, Path())  # (valid until epoch, archive file)
+
+def _current_month_file() -> Path:
+    """
+    Return the archive file for the current (local) month.
+
+    Returns:
+        Path: SMS_STORAGE_DIR / sms-inbox-YYYY-MM.jsonl
+
+    Notes:
+        Cached until the next local month boundary, so the daemon doesn't
+        format the date on every poll.
+    """
+    global _MONTH_CACHE
+    if time.time() >= _MONTH_CACHE[0]:
+        now = datetime.now()
+        next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1)
+        _MONTH_CACHE = (next_month.timestamp(),
+                        SMS_STORAGE_DIR / f"sms-inbox-{now:%Y-%m}.jsonl")
+    return _MONTH_CACHE[1]
+
+# Per-line failures when reading archive entries back: invalid JSON/UTF-8
+# (ValueError), non-dict line or non-str field (AttributeError), wrong key
+# or corrupted ciphertext (InvalidToken, only with cryptography installed)
+_ARCHIVE_ENTRY_ERRORS: tuple[type[Exception], ...] = (
+    (json.JSONDecodeError, ValueError, AttributeError)
+    + ((InvalidToken,) if ENCRYPTION_AVAILABLE else ())
+)
+
+def rebuild_archive_index(sms_file: Path, encryption_key: bytes | None) -> set[int]:
+    """
+    Rebuild the .idx sidecar of a monthly archive from its JSONL entries.
+
+    Args:
+        sms_file: Monthly JSONL archive
+        encryption_key: Fernet key (needed to rehash encrypted entries)
+
+    Returns:
+        set[int]: Hashes of archived SMS (plaintext content, see compute_sms_hash)
+    """
+    archived: set[int] = set()
+    if sms_file.exists():
+        with sms_file.open('rb') as f:
+            for line in f:
+                try:
+                    msg = _json_loads(line)
+                    content = decrypt_sms_content(msg.get('content', ''), encryption_key)
+                    archived.add(_hash_triple(msg.get('number', ''), msg.get('time', ''), content))
+                except _ARCHIVE_ENTRY_ERRORS as e:
+                    # Corrupt line or undecryptable content: skip (no dedup for it)
+                    logger.debug("Skipping archive entry during index rebuild: %s", e)
+        logger.info(f"Rebuilt archive index for {sms_file} ({len(archived)} entries)")
+
+    sms_file.with_suffix('.idx').write_bytes(b''.join(b'%016x\n' % h for h in archived))
+    return archived
+
+def find_archived_hashes(sms_file: Path, hashes: list[int],
+                         encryption_key: bytes | None) -> set[int]:
+    """
+    Return which of the given hashes are already in a monthly archive.
+
+    Args:
+        sms_file: Monthly JSONL archive
+        hashes: Candidate hashes (new SMS)
+        encryption_key: Fernet key (only used if the index must be rebuilt)
+
+    Returns:
+        set[int]: Subset of hashes that are already archived
+
+    Notes:
+        Sidecar: sms-inbox-YYYY-MM.idx, one 16-char hex hash per line.
+        The index is mmap'd and searched per candidate (C-level memmem),
+        so it is neither copied into the Python heap nor parsed. Lines are
+        fixed-width and hex never contains a newline, so "<hash>\\n" can only
+        match a whole line. Missing or corrupt (size not a multiple of the
+        line length) indexes are rebuilt from the archive.
+    """
+    idx_file = sms_file.with_suffix('.idx')
+    try:
+        size = idx_file.stat().st_size
+    except FileNotFoundError:
+        size = -1
+
+    if size < 0 or size % ARCHIVE_INDEX_LINE_LENGTH:
+        if size > 0:
+            logger.warning(f"Corrupted archive index {idx_file}, rebuilding")
+        return rebuild_archive_index(sms_file, encryption_key).intersection(hashes)
+
+    if size == 0:
+        return set()  # mmap can't map empty files
+
+    with idx_file.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return {h for h in hashes if mm.find(b'%016x\n' % h) != -1}
+
 def save_sms_to_json(sms_list: list[SMSMessage], encryption_key: bytes | None) -> bool:
     """
-    Save SMS to monthly-rotated JSON file (encrypted).
+    Append SMS to monthly-rotated JSONL archive (encrypted).
 
     Args:
         sms_list: List of SMS messages to save
@@ -508,53 +901,53 @@ def save_sms_to_json(sms_list: list[SMSMessage], encryption_key: bytes | None) -
         bool: True if save successful
 
     Notes:
-        Format: /var/lib/netgear-sms-gateway/sms-inbox-YYYY-MM.json
-        Appends to existing file (keeps history)
+        Format: /var/lib/netgear-sms-gateway/sms-inbox-YYYY-MM.jsonl (one SMS per line)
+        Append-only: cost is O(new SMS), existing entries are never re-read
+        Hash-deduplicated via .idx sidecar (see find_archived_hashes), so the
+        archive stays duplicate-free even after reset or hash eviction
+        Legacy sms-inbox-YYYY-MM.json files (v1.3.x and earlier) are left untouched
         SMS content is encrypted if key provided (ENC: prefix)
     """
     if not sms_list:
         return True
 
     try:
-        # Get current month for filename
-        current_month = datetime.now().strftime('%Y-%m')
-        sms_file = SMS_STORAGE_DIR / f"sms-inbox-{current_month}.json"
-
-        # Ensure storage directory exists
-        SMS_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+        sms_file = _current_month_file()
 
-        # Load existing SMS (if file exists)
-        existing_sms = []
-        if sms_file.exists():
-            try:
-                existing_sms = json.loads(sms_file.read_text())
-            except json.JSONDecodeError:
-                logger.warning(f"Corrupted SMS file {sms_file}, starting fresh")
-                existing_sms = []
+        # Ensure storage directory exists (SMS_STORAGE_DIR == state directory)
+        _ensure_state_dir()
 
-        # Convert SMSMessage to dict + encrypt content
+        # Skip SMS already archived (robust against ID reset)
+        archived = find_archived_hashes(
+            sms_file, [compute_sms_hash(sms) for sms in sms_list], encryption_key)
         new_sms = []
         for sms in sms_list:
-            sms_dict = asdict(sms)
-            sms_dict['content'] = encrypt_sms_content(sms_dict['content'], encryption_key)
-            new_sms.append(sms_dict)
-
-        # Merge (avoid duplicates by content hash - robust against ID reset)
-        existing_hashes = {compute_sms_hash_dict(msg) for msg in existing_sms}
-        added_count = 0
-        for sms in new_sms:
-            sms_hash = compute_sms_hash_dict(sms)
-            if sms_hash not in existing_hashes:
-                existing_sms.append(sms)
-                existing_hashes.add(sms_hash)  # Prevent duplicates within batch
-                added_count += 1
-
-        # Atomic write (temp file + rename)
-        temp_file = sms_file.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(existing_sms, indent=2, ensure_ascii=False))
-        temp_file.replace(sms_file)
-
-        logger.info(f"Archived {added_count}/{len(new_sms)} SMS to {sms_file} (hash-deduplicated)")
+            sms_hash = compute_sms_hash(sms)
+            if sms_hash not in archived:
+                archived.add(sms_hash)  # Prevent duplicates within batch
+                new_sms.append(sms)
+
+        if new_sms:
+            lines = []
+            for sms in new_sms:
+                # Convert SMSMessage to dict + encrypt content
+                sms_dict = sms.to_dict()
+                sms_dict['content'] = encrypt_sms_content(sms.content, encryption_key)
+                lines.append(_json_dumps(sms_dict))
+            lines.append(b'')  # Trailing newline
+
+            with sms_file.open('ab') as f:
+                # Whole batch in one O_APPEND write (no interleaved partial lines)
+                f.write(b'\n'.join(lines))
+                # One fsync per batch (durability without temp file + rename)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Index after archive: a crash in between can only cause a duplicate
+            with sms_file.with_suffix('.idx').open('ab') as f:
+                f.write(b''.join(b'%016x\n' % compute_sms_hash(sms) for sms in new_sms))
+
+        logger.info(f"Archived {len(new_sms)}/{len(sms_list)} SMS to {sms_file} (hash-deduplicated)")
         return True
 
     except OSError as e:
@@ -573,14 +966,17 @@ def load_state() -> SMSPollerState:
         Ensures state directory exists.
     """
     # Ensure state directory exists
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_state_dir()
 
-    if not STATE_FILE.exists():
+    try:
+        with open(_STATE_PATH, 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
         logger.info("No state file found, initializing new state")
         return SMSPollerState()
 
     try:
-        data = json.loads(STATE_FILE.read_text())
+        data = _json_loads(raw)
 
         # Migration: Add new fields if missing (v1.0 -> v1.1)
         if 'processed_hashes' not in data:
@@ -592,20 +988,59 @@ def load_state() -> SMSPollerState:
             data['max_sms_id_seen'] = data.get('last_processed_sms_id', 0)
             logger.info("Migrated state: added max_sms_id_seen field")
 
+        if 'hash_version' not in data:
+            # Existing hashes are SHA256[:16], keep matching them during transition
+            data['hash_version'] = 1
+            logger.info("Migrated state: legacy SHA256 hashes (BLAKE2b for new SMS)")
+
         # Convert dict to dataclass (handles missing fields gracefully)
-        state = SMSPollerState(**{k: v for k, v in data.items() if k in SMSPollerState.__dataclass_fields__})
-        logger.debug(f"Loaded state: last_processed_sms_id={state.last_processed_sms_id}, total={state.total_sms_received}")
+        state = SMSPollerState.from_dict(data)
+        logger.debug("Loaded state: last_processed_sms_id=%s, total=%s",
+                     state.last_processed_sms_id, state.total_sms_received)
         return state
-    except (json.JSONDecodeError, TypeError) as e:
+    except (json.JSONDecodeError, ValueError, TypeError) as e:
         logger.warning(f"Failed to load state file: {e}, using defaults")
         return SMSPollerState()
 
-def save_state(state: SMSPollerState) -> bool:
+def _atomic_write(path: str, temp_path: str, data: bytes, sync: bool = False) -> None:
+    """
+    Replace file contents atomically (temp file + os.replace).
+
+    Args:
+        path: Target file
+        temp_path: Temp file in the same directory
+        data: New contents
+        sync: fsync the temp file before the rename, the directory after it
+
+    Raises:
+        OSError: On write/rename failure (target file is left untouched)
+    """
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(temp_path, path)
+
+    if sync:
+        # dirname is '' for a bare filename (relative SMS_STATE_DIR=.)
+        dir_fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def save_state(state: SMSPollerState, sync: bool = False) -> bool:
     """
     Save SMS poller state to JSON file (atomic write).
 
     Args:
         state: SMSPollerState to save
+        sync: fsync state file and directory (durable on return)
 
     Returns:
         bool: True if save successful
@@ -613,22 +1048,146 @@ def save_state(state: SMSPollerState) -> bool:
     Notes:
         Uses atomic write pattern (temp file + rename) to prevent corruption.
         Creates parent directory if needed.
+        Skips the write if the state is unchanged (not dirty).
+        With sync=True the directory is fsynced after the rename to persist
+        the rename itself. poll_once runs this in a thread next to the archive
+        append, so both fsyncs overlap.
     """
+    if not state._dirty:
+        logger.debug("State unchanged, skipping save")
+        return True
+
     try:
         # Ensure state directory exists
-        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_state_dir()
 
-        # Atomic write pattern: write to temp, then rename
-        temp_file = STATE_FILE.with_suffix('.tmp')
-        temp_file.write_text(json.dumps(asdict(state), indent=2))
-        temp_file.replace(STATE_FILE)
+        _atomic_write(_STATE_PATH, _STATE_TMP_PATH, _json_dumps(state.to_dict()), sync=sync)
+        state._dirty = False
 
-        logger.debug(f"State saved: last_processed_sms_id={state.last_processed_sms_id}")
+        logger.debug("State saved: last_processed_sms_id=%s", state.last_processed_sms_id)
         return True
     except OSError as e:
         logger.error(f"Failed to save state: {e}")
         return False
 
+@dataclass
+class RetryConfig:
+    """
+    Retry settings for login + SMS fetch (from SMS_RETRY_* env vars).
+
+    Attributes:
+        enabled: Retry transient errors with exponential backoff
+        max_attempts: Attempts per poll (incl. first)
+        initial_delay: First backoff delay in seconds
+        max_delay: Upper bound for backoff delay in seconds
+    """
+    enabled: bool = True
+    max_attempts: int = 3
+    initial_delay: float = 5.0
+    max_delay: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> 'RetryConfig':
+        """Load retry config from ENV."""
+        return cls(
+            enabled=os.getenv("SMS_RETRY_ENABLED", "true").lower() == "true",
+            max_attempts=int(os.getenv("SMS_RETRY_MAX_ATTEMPTS", "3")),
+            initial_delay=float(os.getenv("SMS_RETRY_INITIAL_DELAY", "5")),
+            max_delay=float(os.getenv("SMS_RETRY_MAX_DELAY", "60")),
+        )
+
+async def poll_once(session: aiohttp.ClientSession, state: SMSPollerState,
+                    encryption_key: bytes | None, retry: RetryConfig) -> int:
+    """
+    Run one poll cycle on an existing session and in-memory state.
+
+    Shared by check (one cycle per process) and daemon (one cycle per interval).
+
+    Args:
+        session: aiohttp ClientSession (cookie from previous cycle/run)
+        state: Current SMSPollerState (updated in place, saved if dirty;
+            may hold unsaved SMS when 1 is returned or an exception is raised)
+        encryption_key: Fernet key for encryption (None = plaintext)
+        retry: Retry settings for login + fetch
+
+    Returns:
+        Exit code (0=no_new_sms, 1=error, 2=new_sms)
+
+    Raises:
+        aiohttp.ClientError, json.JSONDecodeError, Exception: On fetch failure
+        asyncio.CancelledError: On shutdown before new SMS are being saved
+    """
+    # Wrap fetch (incl. login if session expired) in retry logic (if enabled)
+    if retry.enabled:
+        sms_list = await retry_with_backoff(
+            fetch_sms_list,
+            retry.max_attempts,
+            retry.initial_delay,
+            retry.max_delay,
+            session,
+            state._hash_set
+        )
+    else:
+        # Fetch SMS list (logs in if session expired)
+        sms_list = await fetch_sms_list(session, state._hash_set)
+
+    # Keep authenticated session for the next run
+    save_cookie_jar(session.cookie_jar)
+
+    # Filter NEW SMS (known hashes already skipped during fetch,
+    # is_new_sms covers legacy hashes and logs ID resets)
+    new_sms = [sms for sms in sms_list if is_new_sms(sms, state)]
+    now = time.time()  # One timestamp per poll for all state updates
+
+    if not new_sms:
+        # No new SMS since last check
+        state.mark_check(now)
+        if not save_state(state):
+            logger.error("Critical: Failed to save state")
+            return 1
+        logger.info("No new SMS")
+        return 0
+
+    # Process new SMS
+    logger.info(f"Found {len(new_sms)} new SMS")
+
+    # Update state with latest SMS (for Telegram forwarding, encrypted)
+    # Process in order, update state with the LAST one
+    for sms in new_sms:
+        logger.info("  SMS #%s from %s: %s...", sms.id, sms.number, sms.content[:50])
+        state.update_with_new_sms(sms, encryption_key, now)
+
+    # Append to monthly JSONL file (encrypted) and save updated state in
+    # parallel threads: both fsync, wall-clock is the slower of the two.
+    # State is final at this point (no mutation while the threads run).
+    saves = asyncio.gather(
+        asyncio.to_thread(save_sms_to_json, new_sms, encryption_key),
+        asyncio.to_thread(save_state, state, True),
+    )
+    try:
+        archived, state_saved = await asyncio.shield(saves)
+    except asyncio.CancelledError:
+        # Shutdown while saving: finish and report the new SMS (exit code 2),
+        # otherwise they would be marked processed but never forwarded.
+        # The writes run in threads either way, so never stop waiting early.
+        logger.info("Shutdown requested while saving, finishing first")
+        while not saves.done():
+            try:
+                await asyncio.shield(saves)
+            except asyncio.CancelledError:
+                pass
+        archived, state_saved = saves.result()
+    if not archived:
+        logger.warning("Failed to save SMS to JSON archive (non-critical)")
+    if not state_saved:
+        logger.error("Critical: Failed to save state after processing SMS")
+        return 1
+
+    logger.info(f"Processed {len(new_sms)} new SMS, last_id={state.last_processed_sms_id}")
+
+    # Exit code 2 signals "new SMS" to Bash wrapper
+    return 2
+
 async def poll_sms() -> int:
     """
     Poll modem for new SMS and process them.
@@ -638,29 +1197,24 @@ async def poll_sms() -> int:
             0: No new SMS
             1: Error (authentication failed, API error)
             2: New SMS forwarded (triggers Telegram alert in wrapper)
-            130: Interrupted by signal (SIGTERM/SIGINT)
 
     Flow:
-        1. Check for shutdown signal (early exit)
-        2. Login to modem (authenticated session)
-        3. Fetch SMS list from API
-        4. Load current state (last_processed_sms_id)
-        5. Filter NEW SMS (id > last_processed_sms_id)
-        6. Save new SMS to monthly JSON file
-        7. Update state with latest SMS
-        8. Return exit code (2 if new SMS, 0 if none)
-    """
-    # Check for shutdown signal before starting
-    if shutdown_requested:
-        logger.info("Shutdown requested before polling, exiting")
-        return 130
-
+        1. Login to modem (skipped if session cookie from last run is valid)
+        2. Fetch SMS list from API
+        3. Load current state (last_processed_sms_id)
+        4. Filter NEW SMS (known hashes skipped while parsing)
+        5. Append new SMS to monthly JSONL file
+        6. Update state with latest SMS
+        7. Return exit code (2 if new SMS, 0 if none)
+
+    Shutdown (SIGTERM/SIGINT) cancels this coroutine, see run_cancellable.
+    """
     # Load current state
     state = load_state()
 
     logger.info(f"Last processed SMS ID: {state.last_processed_sms_id}, "
                 f"Max ID seen: {state.max_sms_id_seen}, "
-                f"Hashes tracked: {len(state.processed_hashes)}")
+                f"Hashes tracked: {len(state._hash_order)}")
 
     # Load encryption key (if enabled)
     encryption_key = get_encryption_key()
@@ -668,100 +1222,146 @@ async def poll_sms() -> int:
         logger.info("Encryption enabled")
 
     # Load retry config from ENV
-    retry_enabled = os.getenv("SMS_RETRY_ENABLED", "true").lower() == "true"
-    max_attempts = int(os.getenv("SMS_RETRY_MAX_ATTEMPTS", "3"))
-    initial_delay = float(os.getenv("SMS_RETRY_INITIAL_DELAY", "5"))
-    max_delay = float(os.getenv("SMS_RETRY_MAX_DELAY", "60"))
-
-    # Use CookieJar for session management (needed for authentication)
-    jar = aiohttp.CookieJar(unsafe=True)
+    retry = RetryConfig.from_env()
+    if retry.enabled:
+        logger.info(f"Retry enabled: max_attempts={retry.max_attempts}")
+    else:
+        logger.info("Retry disabled")
 
     try:
-        async with aiohttp.ClientSession(cookie_jar=jar) as session:
-            # Wrap login + fetch in retry logic (if enabled)
-            if retry_enabled:
-                logger.info(f"Retry enabled: max_attempts={max_attempts}")
-
-                async def login_and_fetch():
-                    """Combined operation for retry (login + fetch SMS)."""
-                    await login(session)
-                    logger.info("Login successful")
-                    return await fetch_sms_list(session)
-
-                sms_list = await retry_with_backoff(
-                    login_and_fetch,
-                    max_attempts=max_attempts,
-                    initial_delay=initial_delay,
-                    max_delay=max_delay
-                )
-            else:
-                # Original behavior (no retry)
-                logger.info("Retry disabled")
-                logger.info("Logging in to modem...")
-                await login(session)
-                logger.info("Login successful")
+        # Use CookieJar for session management (restores cookie from last run)
+        async with create_session(load_cookie_jar()) as session:
+            return await poll_once(session, state, encryption_key, retry)
 
-                # Fetch SMS list
-                sms_list = await fetch_sms_list(session)
+    except aiohttp.ClientError as e:
+        logger.error(f"Network error: {e}")
+        return 1
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON response: {e}")
+        return 1
+    except Exception as e:
+        logger.error(f"Failed to poll SMS: {e}")
+        return 1
 
-            # Check for shutdown signal after HTTP requests
-            if shutdown_requested:
-                logger.info("Shutdown requested after fetch, exiting")
-                return 130
+def sd_notify(message: str) -> None:
+    """Send status to systemd (Type=notify), no-op if NOTIFY_SOCKET is unset."""
+    address = os.environ.get("NOTIFY_SOCKET")
+    if not address:
+        return
 
-            if not sms_list:
-                # No SMS in inbox
-                state.mark_check()
-                if not save_state(state):
-                    logger.error("Critical: Failed to save state")
-                    return 1
-                logger.info("No SMS in modem inbox")
-                return 0
+    # Abstract namespace sockets are announced with a leading '@'
+    if address.startswith("@"):
+        address = "\0" + address[1:]
 
-            # Filter NEW SMS (hash-based deduplication)
-            new_sms = [sms for sms in sms_list if is_new_sms(sms, state)]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall(message.encode('utf-8'))
+    except OSError as e:
+        logger.debug("sd_notify failed: %s", e)
 
-            if not new_sms:
-                # No new SMS since last check
-                state.mark_check()
-                if not save_state(state):
-                    logger.error("Critical: Failed to save state")
-                    return 1
-                logger.info(f"No new SMS (all {len(sms_list)} already processed)")
-                return 0
+async def run_result_hook(hook: str, result: int) -> None:
+    """
+    Run SMS_DAEMON_HOOK with the poll result as last argument (non-critical).
 
-            # Process new SMS
-            logger.info(f"Found {len(new_sms)} new SMS")
+    The Bash wrapper uses this in daemon mode to reuse its check-mode
+    handling (Telegram forwarding, failure counting, recovery alerts).
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *shlex.split(hook), str(result),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        output, _ = await process.communicate()
+    except OSError as e:
+        logger.error(f"Failed to run daemon hook: {e}")
+        return
 
-            # Save to monthly JSON file (encrypted)
-            if not save_sms_to_json(new_sms, encryption_key):
-                logger.warning("Failed to save SMS to JSON archive (non-critical)")
+    for line in output.decode('utf-8', errors='replace').splitlines():
+        logger.info("Hook: %s", line)
+    if process.returncode != 0:
+        logger.warning(f"Daemon hook exited with code {process.returncode}")
 
-            # Update state with latest SMS (for Telegram forwarding, encrypted)
-            # Process in order, update state with the LAST one
-            for sms in new_sms:
-                logger.info(f"  SMS #{sms.id} from {sms.number}: {sms.content[:50]}...")
-                state.update_with_new_sms(sms, encryption_key)
+async def run_daemon(interval: float) -> int:
+    """
+    Poll modem in a loop, keeping session, cookie and state in memory.
 
-            # Save updated state
-            if not save_state(state):
-                logger.error("Critical: Failed to save state after processing SMS")
-                return 1
+    Avoids interpreter startup, cookie reload and state file parsing per
+    poll. New SMS and errors are handed to SMS_DAEMON_HOOK (if set).
 
-            logger.info(f"Processed {len(new_sms)} new SMS, last_id={state.last_processed_sms_id}")
+    Args:
+        interval: Seconds between poll cycles
 
-            # Exit code 2 signals "new SMS" to Bash wrapper
-            return 2
+    Returns:
+        Exit code: 0 on clean shutdown (SIGTERM/SIGINT)
+    """
+    stop = asyncio.Event()
+    poll_task: asyncio.Task | None = None
+
+    def request_stop(sig: signal.Signals) -> None:
+        if stop.is_set():
+            return  # Shutdown already in progress
+        logger.warning(f"Shutdown signal received ({sig.name})")
+        stop.set()
+        # Abort pending modem I/O or retry backoff (saves finish, see poll_once)
+        if poll_task is not None:
+            poll_task.cancel()
+
+    # Wake up the interval sleep immediately on shutdown
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, request_stop, sig)
 
-    except aiohttp.ClientError as e:
-        logger.error(f"Network error: {e}")
-        return 1
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON response: {e}")
-        return 1
-    except Exception as e:
-        logger.error(f"Failed to poll SMS: {e}")
+    state = load_state()
+    encryption_key = get_encryption_key()
+    retry = RetryConfig.from_env()
+    hook = os.getenv("SMS_DAEMON_HOOK", "")
+
+    logger.info(f"Daemon started: interval={interval}s, "
+                f"hashes tracked: {len(state._hash_order)}, "
+                f"hook: {hook or 'none'}")
+    sd_notify("READY=1")
+
+    previous_result = 0
+    async with create_session(load_cookie_jar()) as session:
+        stopped = asyncio.ensure_future(stop.wait())  # Interval sleep, ends early on shutdown
+        while not stop.is_set():
+            poll_task = asyncio.create_task(poll_once(session, state, encryption_key, retry))
+            try:
+                result = await poll_task
+            except asyncio.CancelledError:
+                break
+            except Exception as e:  # noqa: BLE001 - login/token errors are plain Exception; keep polling
+                logger.error(f"Failed to poll SMS: {e}")
+                result = 1
+            finally:
+                poll_task = None
+
+            if result == 1:
+                # In-memory state may already hold SMS whose save failed (or whose
+                # encryption raised): reload the last saved state so they are
+                # retried next poll, as check mode does with a fresh process
+                state = load_state()
+
+            # Hook on new SMS/errors, and once after errors (recovery handling)
+            if hook and (result != 0 or previous_result != 0):
+                await run_result_hook(hook, result)
+            previous_result = result
+            sd_notify(f"STATUS=Last poll: exit {result}, "
+                      f"{state.total_sms_received} SMS received")
+
+            # Returns on timeout or stop, no TimeoutError to catch
+            await asyncio.wait({stopped}, timeout=interval)
+
+    stopped.cancel()
+    sd_notify("STOPPING=1")
+    state.flush_check()
+    if not save_state(state):
+        logger.error("Failed to save state on shutdown")
         return 1
+    logger.info("Daemon stopped")
+    return 0
 
 def show_status() -> int:
     """
@@ -797,6 +1397,22 @@ def show_status() -> int:
 
     return 0
 
+def format_state() -> int:
+    """
+    Pretty-print state file (stored compact on disk).
+
+    Returns:
+        Exit code: 0 if success, 1 if missing/corrupt
+    """
+    try:
+        data = _json_loads(STATE_FILE.read_bytes())
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"ERROR: Cannot read state file {STATE_FILE}: {e}")
+        return 1
+
+    print(_json_dumps(data, indent=True).decode('utf-8'))
+    return 0
+
 def reset_state() -> int:
     """
     Reset SMS poller state (emergency use).
@@ -805,6 +1421,7 @@ def reset_state() -> int:
         Exit code: 0 if success, 1 if failed
     """
     state = SMSPollerState()
+    state._dirty = True  # Always overwrite existing state file
     if save_state(state):
         logger.info("State reset successfully")
         print("State reset: last_processed_sms_id=0")
@@ -898,16 +1515,13 @@ async def list_sms() -> int:
     Returns:
         Exit code: 0 if success, 1 if failed
     """
-    jar = aiohttp.CookieJar(unsafe=True)
+    jar = load_cookie_jar()
 
     try:
-        async with aiohttp.ClientSession(cookie_jar=jar) as session:
-            # Login
-            await login(session)
-            logger.info("Login successful")
-
-            # Fetch SMS
+        async with create_session(jar) as session:
+            # Fetch SMS (logs in if session expired)
             sms_list = await fetch_sms_list(session)
+            save_cookie_jar(jar)
 
             if not sms_list:
                 print("No SMS in modem inbox")
@@ -930,6 +1544,45 @@ async def list_sms() -> int:
         logger.error(f"Failed to list SMS: {e}")
         return 1
 
+async def run_cancellable(coro) -> int:
+    """
+    Run coroutine as a task that SIGTERM/SIGINT cancel.
+
+    Args:
+        coro: Coroutine returning an exit code
+
+    Returns:
+        Exit code of coro, 130 if cancelled by a signal
+    """
+    task = asyncio.ensure_future(coro)
+    cancel_requested = False
+
+    def cancel(sig: signal.Signals) -> None:
+        nonlocal cancel_requested
+        if cancel_requested:
+            return  # Shutdown already in progress
+        cancel_requested = True
+        logger.warning(f"Shutdown signal received ({sig.name})")
+        task.cancel()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, cancel, sig)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        logger.info("Shutdown requested, exiting")
+        return 130
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
+
+def run_async(coro) -> Any:
+    """Run coroutine to completion on uvloop if installed, stdlib event loop otherwise."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
 def main() -> int:
     """
     Main entry point with CLI argument parsing.
@@ -942,37 +1595,50 @@ def main() -> int:
         epilog="""
 Examples:
   %(prog)s check                  # Poll for new SMS (standard mode)
+  %(prog)s daemon --interval 60   # Poll in a loop (long-running service)
   %(prog)s status                 # Show current state
   %(prog)s reset                  # Reset state (emergency)
   %(prog)s list                   # List all SMS in modem inbox
+  %(prog)s format                 # Pretty-print state file
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
     parser.add_argument(
         'action',
-        choices=['check', 'status', 'reset', 'list', 'generate-key', 'health'],
+        choices=['check', 'daemon', 'status', 'reset', 'list', 'generate-key', 'health', 'format'],
         nargs='?',
         default='check',
         help='Action to perform (default: check)'
     )
 
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=float(os.getenv("SMS_POLL_INTERVAL", "300")),
+        help='Seconds between polls in daemon mode (default: SMS_POLL_INTERVAL or 300)'
+    )
+
     args = parser.parse_args()
 
     try:
         # Handle actions
         if args.action == 'check':
-            return asyncio.run(poll_sms())
+            return run_async(run_cancellable(poll_sms()))
+        elif args.action == 'daemon':
+            return run_async(run_daemon(args.interval))
         elif args.action == 'status':
             return show_status()
         elif args.action == 'reset':
             return reset_state()
         elif args.action == 'list':
-            return asyncio.run(list_sms())
+            return run_async(run_cancellable(list_sms()))
         elif args.action == 'generate-key':
             return generate_encryption_key()
         elif args.action == 'health':
-            return asyncio.run(health_check())
+            return run_async(run_cancellable(health_check()))
+        elif args.action == 'format':
+            return format_state()
         else:
             logger.error(f"Unknown action: {args.action}")
             return 1
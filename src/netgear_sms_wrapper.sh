@@ -6,9 +6,12 @@
 # Netgear LM1200 SMS Poller - Telegram Forwarding Wrapper
 # Delegates SMS polling to Python, handles Telegram alerts
 #
-# Version: 1.2.0 - Transient Failure Alert Suppression
+# Version: 1.3.0 - Daemon Mode
 #
 # Changelog:
+#  - v1.3.0 (15.10.2026): Daemon mode
+#    - New modes: daemon (exec Python polling loop), result <exit_code>
+#    - Exit code handling factored into handle_poll_result (shared by both)
 #  - v1.2.0 (14.02.2026): Transient failure alert suppression
 #    - Consecutive failure tracking via FAILURE_COUNT_FILE
 #    - Alert only after SMS_FAILURE_THRESHOLD consecutive failures (default: 3)
@@ -51,7 +54,7 @@ if ! SCRIPT_NAME="$(basename "$0" .sh)"; then
 fi
 readonly SCRIPT_NAME
 
-readonly SCRIPT_VERSION="1.2.0"
+readonly SCRIPT_VERSION="1.3.0"
 
 # Python script in same directory (uses venv in repo root)
 readonly PYTHON_SCRIPT="${SCRIPT_DIR}/netgear_sms_poller.py"
@@ -240,25 +243,9 @@ check_prerequisites() {
 # Main SMS Poller Logic
 # ============================================================================
 
-main() {
-    # Validate prerequisites before processing
-    if ! check_prerequisites; then
-        log_error "Prerequisite check failed, cannot continue"
-        return 1
-    fi
-
-    log_info "=== Netgear LM1200 SMS Poller Check ==="
-
-    # Run Python SMS poller
-    # Python returns: 0=no_new_sms, 1=error, 2=new_sms_forwarded
-    local sms_output
-    sms_output=$("$PYTHON_VENV" "$PYTHON_SCRIPT" check 2>&1)
-    local sms_exit=$?
-
-    # Log Python script output
-    echo "$sms_output" | while IFS= read -r line; do
-        log_info "Python: $line"
-    done
+# Handle a poll result (Python exit code) - shared by check and daemon mode
+handle_poll_result() {
+    local sms_exit="$1"
 
     # Handle exit codes from Python
     case $sms_exit in
@@ -370,5 +357,60 @@ ${sms_content}"
     esac
 }
 
+main() {
+    # Validate prerequisites before processing
+    if ! check_prerequisites; then
+        log_error "Prerequisite check failed, cannot continue"
+        return 1
+    fi
+
+    log_info "=== Netgear LM1200 SMS Poller Check ==="
+
+    # Run Python SMS poller
+    # Python returns: 0=no_new_sms, 1=error, 2=new_sms_forwarded
+    local sms_output
+    sms_output=$("$PYTHON_VENV" "$PYTHON_SCRIPT" check 2>&1)
+    local sms_exit=$?
+
+    # Log Python script output
+    echo "$sms_output" | while IFS= read -r line; do
+        log_info "Python: $line"
+    done
+
+    handle_poll_result "$sms_exit"
+}
+
+# Long-running mode: Python polls in a loop and calls back into this
+# script ("result <exit_code>") for forwarding and failure alerts
+run_daemon() {
+    if ! check_prerequisites; then
+        log_error "Prerequisite check failed, cannot continue"
+        return 1
+    fi
+
+    log_info "=== Netgear LM1200 SMS Poller Daemon ==="
+
+    export SMS_DAEMON_HOOK="${SCRIPT_DIR}/netgear_sms_wrapper.sh result"
+
+    # exec: Python becomes the main process (required for systemd Type=notify)
+    exec "$PYTHON_VENV" "$PYTHON_SCRIPT" daemon
+}
+
 # Run main function if script is executed directly
-[[ "${BASH_SOURCE[0]}" == "${0}" ]] && main "$@"
+if [[ "${BASH_SOURCE[0]}" == "${0}" ]]; then
+    case "${1:-check}" in
+        check)
+            main
+            ;;
+        daemon)
+            run_daemon
+            ;;
+        result)
+            handle_poll_result "${2:-1}"
+            ;;
+        *)
+            log_error "Usage: ${SCRIPT_NAME} [check|daemon|result <exit_code>]"
+            exit 1
+            ;;
+    esac
+fi